@@ -8,18 +8,37 @@ from awesomeversion import AwesomeVersion
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
     Platform,
     __short_version__,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.components.persistent_notification import (
     DOMAIN as PERSISTENT_NOTIFICATION_DOMAIN,
 )
 from homeassistant.helpers.issue_registry import async_create_issue, IssueSeverity
+from homeassistant.util import dt as dt_util
 
-from .api import WeatherKitApiClient
-from .const import DOMAIN, CONF_KEY_ID, CONF_SERVICE_ID, CONF_TEAM_ID, CONF_KEY_PEM
+from .api import (
+    DEFAULT_DATA_SETS,
+    WeatherKitApiClient,
+    WeatherKitApiClientAuthenticationError,
+    WeatherKitApiClientError,
+)
+from .const import (
+    DOMAIN,
+    LOGGER,
+    CONF_AVAILABILITY,
+    CONF_AVAILABILITY_UPDATED,
+    STORED_AVAILABILITY_TTL,
+    CONF_KEY_ID,
+    CONF_SERVICE_ID,
+    CONF_TEAM_ID,
+    CONF_KEY_PEM,
+)
 from .coordinator import WeatherKitDataUpdateCoordinator
 
 PLATFORMS: list[Platform] = [Platform.WEATHER]
@@ -50,16 +69,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             },
         )
 
+    client = WeatherKitApiClient(
+        key_id=entry.data[CONF_KEY_ID],
+        service_id=entry.data[CONF_SERVICE_ID],
+        team_id=entry.data[CONF_TEAM_ID],
+        key_pem=entry.data[CONF_KEY_PEM],
+        session=async_get_clientsession(hass),
+    )
+
+    availability = await _async_get_availability(hass, entry, client)
+    data_sets = [
+        data_set for data_set in DEFAULT_DATA_SETS if data_set in availability
+    ]
+    if not data_sets:
+        raise ConfigEntryNotReady(
+            "WeatherKit does not currently provide any supported data sets for this location"
+        )
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator = WeatherKitDataUpdateCoordinator(
         hass=hass,
-        client=WeatherKitApiClient(
-            key_id=entry.data[CONF_KEY_ID],
-            service_id=entry.data[CONF_SERVICE_ID],
-            team_id=entry.data[CONF_TEAM_ID],
-            key_pem=entry.data[CONF_KEY_PEM],
-            session=async_get_clientsession(hass),
-        ),
+        client=client,
+        data_sets=data_sets,
     )
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await coordinator.async_config_entry_first_refresh()
@@ -70,6 +101,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_get_availability(
+    hass: HomeAssistant, entry: ConfigEntry, client: WeatherKitApiClient
+) -> list[str]:
+    """Return the stored availability, refreshing it once it is stale."""
+    availability = entry.data.get(CONF_AVAILABILITY)
+    updated = entry.data.get(CONF_AVAILABILITY_UPDATED)
+    if (
+        availability is not None
+        and updated is not None
+        and (updated_at := dt_util.parse_datetime(updated)) is not None
+        and dt_util.utcnow() - updated_at < STORED_AVAILABILITY_TTL
+    ):
+        return availability
+
+    try:
+        fresh_availability = await client.get_availability(
+            entry.data[CONF_LATITUDE],
+            entry.data[CONF_LONGITUDE],
+        )
+    except WeatherKitApiClientError as exception:
+        if availability is not None:
+            LOGGER.warning(
+                "Could not refresh data set availability, using stored value: %s",
+                exception,
+            )
+            return availability
+        if isinstance(exception, WeatherKitApiClientAuthenticationError):
+            raise ConfigEntryAuthFailed(exception) from exception
+        raise ConfigEntryNotReady(exception) from exception
+
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            **entry.data,
+            CONF_AVAILABILITY: fresh_availability,
+            CONF_AVAILABILITY_UPDATED: dt_util.utcnow().isoformat(),
+        },
+    )
+    return fresh_availability
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -9,9 +9,47 @@ from urllib.parse import urlencode
 import aiohttp
 import async_timeout
 import datetime
+import hashlib
 
 import jwt
 
+from homeassistant.util import dt as dt_util
+
+DEFAULT_DATA_SETS = ["currentWeather", "forecastDaily", "forecastHourly"]
+
+TOKEN_TTL = datetime.timedelta(minutes=30)
+TOKEN_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+AVAILABILITY_CACHE_TTL = datetime.timedelta(hours=1)
+
+# Rounding to 2 decimal places groups locations within roughly 1 km
+AVAILABILITY_LOCATION_PRECISION = 2
+
+# Shared between every client in the process so that config flow validation
+# and entry setup reuse the same signed token and availability lookups.
+# Both are keyed by credentials (with the private key hashed) and pruned of
+# expired entries on every lookup.
+_CredentialsKey = tuple[str, str, str, str]
+_token_cache: dict[_CredentialsKey, tuple[str, datetime.datetime]] = {}
+_availability_cache: dict[
+    tuple[_CredentialsKey, float, float], tuple[list[str], datetime.datetime]
+] = {}
+
+
+def _evict_expired(now: datetime.datetime) -> None:
+    """Drop cached tokens and availability results that can no longer be used."""
+    for key in [
+        key
+        for key, (_, expires_at) in _token_cache.items()
+        if expires_at - now <= TOKEN_REFRESH_MARGIN
+    ]:
+        del _token_cache[key]
+    for key in [
+        key
+        for key, (_, fetched_at) in _availability_cache.items()
+        if now - fetched_at >= AVAILABILITY_CACHE_TTL
+    ]:
+        del _availability_cache[key]
+
 
 class WeatherKitApiClientError(Exception):
     """Exception to indicate a general API error."""
@@ -39,15 +77,27 @@ class WeatherKitApiClient:
         self._team_id = team_id
         self._key_pem = key_pem
         self._session = session
+        self._credentials_key: _CredentialsKey = (
+            team_id,
+            service_id,
+            key_id,
+            hashlib.sha256(key_pem.encode()).hexdigest(),
+        )
 
     async def get_weather_data(
-        self, lat: float, lon: float, lang: str = "en-US"
+        self,
+        lat: float,
+        lon: float,
+        lang: str = "en-US",
+        data_sets: list[str] | None = None,
     ) -> any:
         """OBTAIN WEATHER DATA!!!!!!!!!!"""
-        token = self._generate_jwt()
+        token = self._get_token()
         query = urlencode(
             OrderedDict(
-                dataSets="currentWeather,forecastDaily,forecastHourly",
+                dataSets=",".join(
+                    DEFAULT_DATA_SETS if data_sets is None else data_sets
+                ),
                 hourlyStart=datetime.datetime.utcnow().isoformat() + "Z",
                 hourlyEnd=(
                     datetime.datetime.utcnow() + datetime.timedelta(days=1)
@@ -61,21 +111,60 @@ class WeatherKitApiClient:
             headers={"Authorization": f"Bearer {token}"},
         )
 
-    async def get_availability(self, lat: float, lon: float) -> any:
-        """Determine availability of different weather data sets."""
-        token = self._generate_jwt()
-        return await self._api_wrapper(
+    async def get_availability(self, lat: float, lon: float) -> list[str]:
+        """Determine availability of different weather data sets.
+
+        Results are cached per credentials and rounded location for
+        AVAILABILITY_CACHE_TTL.
+        """
+        now = dt_util.utcnow()
+        _evict_expired(now)
+
+        cache_key = (
+            self._credentials_key,
+            round(lat, AVAILABILITY_LOCATION_PRECISION),
+            round(lon, AVAILABILITY_LOCATION_PRECISION),
+        )
+        if (cached := _availability_cache.get(cache_key)) is not None:
+            return cached[0]
+
+        token = self._get_token()
+        availability = await self._api_wrapper(
             method="get",
             url=f"https://weatherkit.apple.com/api/v1/availability/{lat}/{lon}",
             headers={"Authorization": f"Bearer {token}"},
         )
-
-    def _generate_jwt(self) -> str:
+        _availability_cache[cache_key] = (availability, now)
+        return availability
+
+    def _get_token(self) -> str:
+        """Return a signed token, reusing the cached one until it nears expiry."""
+        now = dt_util.utcnow()
+        _evict_expired(now)
+        if (cached := _token_cache.get(self._credentials_key)) is not None:
+            return cached[0]
+
+        expires_at = now + TOKEN_TTL
+        token = self._generate_jwt(now, expires_at)
+        _token_cache[self._credentials_key] = (token, expires_at)
+        return token
+
+    def _invalidate_credentials(self) -> None:
+        """Forget the token and availability results cached for these credentials."""
+        _token_cache.pop(self._credentials_key, None)
+        for key in [
+            key for key in _availability_cache if key[0] == self._credentials_key
+        ]:
+            del _availability_cache[key]
+
+    def _generate_jwt(
+        self, issued_at: datetime.datetime, expires_at: datetime.datetime
+    ) -> str:
         return jwt.encode(
             {
                 "iss": self._team_id,
-                "iat": datetime.datetime.utcnow(),
-                "exp": datetime.datetime.utcnow() + datetime.timedelta(minutes=30),
+                "iat": issued_at,
+                "exp": expires_at,
                 "sub": self._service_id,
             },
             self._key_pem,
@@ -101,6 +190,7 @@ class WeatherKitApiClient:
                 )
 
                 if response.status in (401, 403):
+                    self._invalidate_credentials()
                     body = await response.text()
                     raise WeatherKitApiClientAuthenticationError(
                         f"Invalid credentials: {body}",
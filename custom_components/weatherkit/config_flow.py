@@ -1,6 +1,6 @@
 """Adds config flow for WeatherKit."""
 from __future__ import annotations
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -8,6 +8,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
+from homeassistant.util import dt as dt_util
 
 from .api import (
     WeatherKitApiClient,
@@ -16,6 +17,8 @@ from .api import (
     WeatherKitApiClientError,
 )
 from .const import (
+    CONF_AVAILABILITY,
+    CONF_AVAILABILITY_UPDATED,
     CONF_KEY_ID,
     CONF_KEY_PEM,
     CONF_SERVICE_ID,
@@ -88,7 +91,7 @@ class WeatherKitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         _errors = {}
         if user_input is not None:
             try:
-                await self._test_config(user_input)
+                availability = await self._test_config(user_input)
             except WeatherKitUnsupportedLocationError as exception:
                 LOGGER.error(exception)
                 _errors["base"] = "unsupported_location"
@@ -104,7 +107,11 @@ class WeatherKitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
-                    data=user_input,
+                    data={
+                        **user_input,
+                        CONF_AVAILABILITY: availability,
+                        CONF_AVAILABILITY_UPDATED: dt_util.utcnow().isoformat(),
+                    },
                 )
 
         return self.async_show_form(
@@ -113,14 +120,14 @@ class WeatherKitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=_errors,
         )
 
-    async def _test_config(self, user_input) -> None:
-        """Validate credentials."""
+    async def _test_config(self, user_input) -> list[str]:
+        """Validate credentials and return the data sets available at the location."""
         client = WeatherKitApiClient(
             key_id=user_input[CONF_KEY_ID],
             service_id=user_input[CONF_SERVICE_ID],
             team_id=user_input[CONF_TEAM_ID],
             key_pem=user_input[CONF_KEY_PEM],
-            session=async_create_clientsession(self.hass),
+            session=async_get_clientsession(self.hass),
         )
 
         availability = await client.get_availability(
@@ -132,3 +139,5 @@ class WeatherKitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             raise WeatherKitUnsupportedLocationError(
                 "API does not support this location"
             )
+
+        return availability
@@ -1,4 +1,5 @@
 """Constants for weatherkit."""
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -12,3 +13,9 @@ CONF_KEY_ID = "key_id"
 CONF_SERVICE_ID = "service_id"
 CONF_TEAM_ID = "team_id"
 CONF_KEY_PEM = "key_pem"
+CONF_AVAILABILITY = "availability"
+CONF_AVAILABILITY_UPDATED = "availability_updated"
+
+# Availability stored on the config entry is only re-fetched at setup once it
+# is this old, so ordinary restarts do not cost an extra request
+STORED_AVAILABILITY_TTL = timedelta(days=7)
@@ -17,6 +17,7 @@ from homeassistant.const import (
 )
 
 from .api import (
+    DEFAULT_DATA_SETS,
     WeatherKitApiClient,
     WeatherKitApiClientAuthenticationError,
     WeatherKitApiClientError,
@@ -34,9 +35,11 @@ class WeatherKitDataUpdateCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         client: WeatherKitApiClient,
+        data_sets: list[str] | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
+        self.data_sets = DEFAULT_DATA_SETS if data_sets is None else data_sets
         super().__init__(
             hass=hass,
             logger=LOGGER,
@@ -50,6 +53,7 @@ class WeatherKitDataUpdateCoordinator(DataUpdateCoordinator):
             return await self.client.get_weather_data(
                 self.config_entry.data[CONF_LATITUDE],
                 self.config_entry.data[CONF_LONGITUDE],
+                data_sets=self.data_sets,
             )
         except WeatherKitApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
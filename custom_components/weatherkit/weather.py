@@ -125,10 +125,6 @@ class WeatherKitWeather(
     _attr_native_visibility_unit = UnitOfLength.KILOMETERS
     _attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
 
-    _attr_supported_features = (
-        WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
-    )
-
     def __init__(
         self,
         coordinator: WeatherKitDataUpdateCoordinator,
@@ -138,6 +134,18 @@ class WeatherKitWeather(
         super().__init__(coordinator)
         self._config = config
 
+        features = WeatherEntityFeature(0)
+        if "forecastDaily" in coordinator.data_sets:
+            features |= WeatherEntityFeature.FORECAST_DAILY
+        if "forecastHourly" in coordinator.data_sets:
+            features |= WeatherEntityFeature.FORECAST_HOURLY
+        self._attr_supported_features = features
+
+    @property
+    def _current_weather(self) -> dict[str, Any]:
+        """Return current conditions, or an empty dict if they are unavailable."""
+        return self.coordinator.data.get("currentWeather") or {}
+
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
@@ -152,14 +160,14 @@ class WeatherKitWeather(
     @property
     def condition(self) -> str | None:
         """Return the current condition."""
-        condition_code = self.coordinator.data.get("currentWeather").get(
-            "conditionCode"
-        )
+        condition_code = self._current_weather.get("conditionCode")
+        if condition_code is None:
+            return None
         condition = condition_code_to_hass[condition_code]
 
         if (
             condition == "sunny"
-            and self.coordinator.data.get("currentWeather").get("daylight") is False
+            and self._current_weather.get("daylight") is False
         ):
             condition = "clear-night"
 
@@ -168,71 +176,73 @@ class WeatherKitWeather(
     @property
     def native_temperature(self) -> float | None:
         """Return the current temperature."""
-        temperature = self.coordinator.data.get("currentWeather").get("temperature")
+        temperature = self._current_weather.get("temperature")
         return temperature
 
     @property
     def native_apparent_temperature(self) -> float | None:
         """Return the current apparent_temperature."""
-        apparent_temperature = self.coordinator.data.get("currentWeather").get(
-            "temperatureApparent"
-        )
+        apparent_temperature = self._current_weather.get("temperatureApparent")
         return apparent_temperature
 
     @property
     def native_dew_point(self) -> float | None:
         """Return the current dew_point."""
-        dew_point = self.coordinator.data.get("currentWeather").get(
-            "temperatureDewPoint"
-        )
+        dew_point = self._current_weather.get("temperatureDewPoint")
         return dew_point
 
     @property
     def native_pressure(self) -> float | None:
         """Return the current pressure."""
-        pressure = self.coordinator.data.get("currentWeather").get("pressure")
+        pressure = self._current_weather.get("pressure")
         return pressure
 
     @property
     def humidity(self) -> float | None:
         """Return the current humidity."""
-        humidity = self.coordinator.data.get("currentWeather").get("humidity")
+        humidity = self._current_weather.get("humidity")
+        if humidity is None:
+            return None
         return humidity * 100
 
     @property
     def cloud_coverage(self) -> int | None:
         """Return the current cloud_coverage."""
-        cloud_coverage = self.coordinator.data.get("currentWeather").get("cloudCover")
+        cloud_coverage = self._current_weather.get("cloudCover")
+        if cloud_coverage is None:
+            return None
         return cloud_coverage * 100
 
     @property
     def uv_index(self) -> float | None:
         """Return the current uv_index."""
-        uv_index = self.coordinator.data.get("currentWeather").get("uvIndex")
+        uv_index = self._current_weather.get("uvIndex")
         return uv_index
 
     @property
     def native_visibility(self) -> float | None:
         """Return the current visibility."""
-        visibility = self.coordinator.data.get("currentWeather").get("visibility")
+        visibility = self._current_weather.get("visibility")
+        if visibility is None:
+            return None
         return visibility / 1000
 
     @property
     def native_wind_gust_speed(self) -> float | None:
         """Return the current wind_gust_speed."""
-        wind_gust_speed = self.coordinator.data.get("currentWeather").get("windGust")
+        wind_gust_speed = self._current_weather.get("windGust")
         return wind_gust_speed
 
     @property
     def native_wind_speed(self) -> float | None:
         """Return the current wind_speed."""
-        wind_speed = self.coordinator.data.get("currentWeather").get("windSpeed")
+        wind_speed = self._current_weather.get("windSpeed")
         return wind_speed
 
     @property
     def wind_bearing(self) -> float | None:
         """Return the current wind_bearing."""
-        wind_bearing = self.coordinator.data.get("currentWeather").get("windDirection")
+        wind_bearing = self._current_weather.get("windDirection")
         return wind_bearing
 
     @callback